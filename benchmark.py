@@ -0,0 +1,86 @@
+"""Benchmarks for the To-Do app data structures.
+
+Run with: python benchmark.py
+"""
+import os
+import random
+import tempfile
+import time
+
+from main import Board, BoardStore, BoardCache
+
+
+def make_board(name, size):
+    board = Board(name)
+    for i in range(size):
+        board.add_task(f"{name} task {i}", random.randint(1, 10))
+    return board
+
+
+def percentile(samples, fraction):
+    # Nearest-rank percentile of an already sorted list
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def report_latencies(latencies, indent="  "):
+    print(f"{indent}{'Operation':<22}{'Count':>8}{'Mean us':>10}{'p50 us':>10}"
+          f"{'p95 us':>10}{'p99 us':>10}{'Max us':>10}")
+    for op, samples in latencies.items():
+        samples = sorted(samples)
+        print(f"{indent}{op:<22}{len(samples):>8}"
+              f"{sum(samples) / len(samples) * 1e6:>10.1f}"
+              f"{percentile(samples, 0.5) * 1e6:>10.1f}"
+              f"{percentile(samples, 0.95) * 1e6:>10.1f}"
+              f"{percentile(samples, 0.99) * 1e6:>10.1f}"
+              f"{samples[-1] * 1e6:>10.1f}")
+
+
+def timed_switch(cache, name, samples):
+    # Headless part of ToDoApp.switch_board: load the board, build the
+    # merged task list shown in the listbox and rescan the board names
+    start = time.perf_counter()
+    board = cache.get(name)
+    loaded = time.perf_counter()
+    board.merged_tasks()
+    merged = time.perf_counter()
+    cache.store.list_boards()
+    end = time.perf_counter()
+
+    samples["cache get"].append(loaded - start)
+    samples["merged task list"].append(merged - loaded)
+    samples["list boards"].append(end - merged)
+    samples["total"].append(end - start)
+
+
+def bench_board_switch(boards=20, tasks_per_board=200, capacity=3, switches=200):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BoardStore(directory=os.path.join(tmp, "boards"),
+                           default_file=os.path.join(tmp, "todo_data.json"))
+        names = [f"board{i}" for i in range(boards)]
+        for name in names:
+            store.save(make_board(name, tasks_per_board))
+
+        cache = BoardCache(store, capacity=capacity)
+
+        # Cold: every switch misses the cache, loads from disk and evicts
+        cold = {step: [] for step in ("cache get", "merged task list", "list boards", "total")}
+        for i in range(switches):
+            timed_switch(cache, names[i % boards], cold)
+
+        # Warm: cycle through boards that are already resident
+        warm = {step: [] for step in cold}
+        resident = cache.resident()
+        for i in range(switches):
+            timed_switch(cache, resident[i % len(resident)], warm)
+
+    print(f"Board switch ({boards} boards x {tasks_per_board} tasks, capacity {capacity})")
+    for label, samples in (("cold, load + evict", cold), ("warm, resident", warm)):
+        print(f"  Switch ({label})")
+        report_latencies(samples, indent="    ")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    bench_board_switch()
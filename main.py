@@ -1,7 +1,9 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-from collections import deque
+from tkinter import ttk, messagebox, filedialog
+from collections import deque, OrderedDict
 import json
+import os
+import time
 
 
 class QueueToDo:
@@ -149,10 +151,12 @@ class BSTToDo:
 
     def __init__(self):
         self.root = None
+        self.size = 0
         self.completed_tasks = []
 
     def add_task(self, priority, task):
         self.root = self._insert(self.root, priority, task)
+        self.size += 1
 
     def _insert(self, node, priority, task):
         if node is None:
@@ -173,6 +177,7 @@ class BSTToDo:
             parent.right = current.left
         else:
             self.root = current.left
+        self.size -= 1
         self.completed_tasks.append(current.task)
         return current.task
 
@@ -192,6 +197,7 @@ class BSTToDo:
         new_tasks = [t for t in all_tasks if not t.endswith(task)]
 
         self.root = None
+        self.size = 0
         for task_str in new_tasks:
             try:
                 priority_str, task_content = task_str.split(": ", 1)
@@ -201,13 +207,464 @@ class BSTToDo:
                 continue
         return task in [t.split(": ", 1)[1] for t in all_tasks]
 
+    def height(self):
+        return self._height(self.root)
+
+    def _height(self, node):
+        if node is None:
+            return 0
+        return 1 + max(self._height(node.left), self._height(node.right))
+
     def clear(self):
         self.root = None
+        self.size = 0
         self.completed_tasks = []
 
 
+class LatencyHistogram:
+    """Latency histogram with power-of-two microsecond buckets."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = {}
+
+    def record(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        # Bucket i holds samples in [2^(i-1), 2^i) microseconds
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        # Upper bound (in seconds) of the bucket holding the given percentile
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min((1 << bucket) / 1_000_000, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "min_ms": (self.min or 0.0) * 1000,
+            "max_ms": self.max * 1000,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p95_ms": self.percentile(0.95) * 1000,
+            "buckets_us": {str(1 << b): n for b, n in sorted(self.buckets.items())}
+        }
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Timer:
+    def __init__(self, profiler, operation):
+        self.profiler = profiler
+        self.operation = operation
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.operation, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Profiler:
+    """Collects per-operation latencies and structure sizes.
+
+    While disabled, `measure` hands back a shared no-op context manager,
+    so instrumented code only pays for an attribute check.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.histograms = {}
+        self.gauges = {}
+
+    def measure(self, operation):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, operation)
+
+    def record(self, operation, seconds):
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def sample_board(self, board):
+        # Constant-time gauges, cheap enough to take on every refresh
+        if not self.enabled:
+            return
+        self.gauges.update({
+            "queue_size": len(board.queue.tasks),
+            "stack_size": len(board.stack.tasks),
+            "stack_history_size": len(board.stack.completed_stack),
+            "linked_list_size": board.linked_list.size,
+            "bst_size": board.bst.size,
+            "history_size": len(board.completed_history)
+        })
+
+    def sample_height(self, board):
+        # Walks the whole tree, so it is only taken on demand
+        if not self.enabled:
+            return
+        self.gauges["bst_height"] = board.bst.height()
+
+    def reset(self):
+        self.histograms.clear()
+        self.gauges.clear()
+
+    def to_dict(self):
+        return {
+            "operations": {op: h.to_dict() for op, h in sorted(self.histograms.items())},
+            "gauges": dict(self.gauges)
+        }
+
+    def report(self):
+        lines = [f"{'Operation':<40}{'Count':>7}{'Mean ms':>10}{'p95 ms':>10}{'Max ms':>10}"]
+        for op, histogram in sorted(self.histograms.items()):
+            stats = histogram.to_dict()
+            lines.append(f"{op:<40}{stats['count']:>7}{stats['mean_ms']:>10.3f}"
+                         f"{stats['p95_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+        lines.append("")
+        for name, value in self.gauges.items():
+            lines.append(f"{name:<40}{value:>7}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class TraceRecorder:
+    """Appends user operations to a trace file, one JSON array per line.
+
+    Without a path nothing is recorded. Sessions are appended to the
+    file, each opening with a "start" record. The first time a board is
+    activated in a session its stored data is written along with it, so
+    a replay can start from the same state.
+    """
+
+    def __init__(self, path=None):
+        self.file = open(path, "a") if path else None
+        self.seen_boards = set()
+
+    def record(self, operation, *args):
+        if self.file is None:
+            return
+        self.file.write(json.dumps([operation, *args], separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def record_board(self, name, store=None):
+        # Without a store the board is recorded as starting empty
+        if self.file is None:
+            return
+        if name in self.seen_boards:
+            self.record("board", name)
+        else:
+            self.seen_boards.add(name)
+            self.record("board", name, store.read(name) if store is not None else {})
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_trace(path):
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class Board:
+    def __init__(self, name, profiler=None):
+        self.name = name
+        self.queue = QueueToDo()
+        self.stack = StackToDo()
+        self.linked_list = LinkedListToDo()
+        self.bst = BSTToDo()
+        self.completed_history = []
+        self.profiler = profiler if profiler is not None else Profiler()
+
+    def add_task(self, task, priority):
+        with self.profiler.measure("add"):
+            # Add to all data structures
+            self.queue.add_task(task)
+            self.stack.add_task(task)
+            self.linked_list.add_task(task)
+            self.bst.add_task(priority, task)
+
+    def complete_queue_task(self):
+        with self.profiler.measure("complete_queue"):
+            with self.profiler.measure("complete_queue.pop"):
+                completed = self.queue.complete_task()
+            if completed:
+                # Remove from other data structures
+                with self.profiler.measure("complete_queue.remove.stack"):
+                    self.stack.remove_task(completed)
+                with self.profiler.measure("complete_queue.remove.linked_list"):
+                    self.linked_list.remove_task(completed)
+                with self.profiler.measure("complete_queue.remove.bst"):
+                    self.bst.remove_task(completed)
+
+                # Add to global history
+                self.completed_history.append(("Queue", completed))
+        return completed
+
+    def complete_stack_task(self):
+        with self.profiler.measure("complete_stack"):
+            with self.profiler.measure("complete_stack.pop"):
+                completed = self.stack.complete_task()
+            if completed:
+                # Remove from other data structures
+                with self.profiler.measure("complete_stack.remove.queue"):
+                    self.queue.remove_task(completed)
+                with self.profiler.measure("complete_stack.remove.linked_list"):
+                    self.linked_list.remove_task(completed)
+                with self.profiler.measure("complete_stack.remove.bst"):
+                    self.bst.remove_task(completed)
+
+                # Add to global history
+                self.completed_history.append(("Stack", completed))
+        return completed
+
+    def complete_linked_list_task(self, task):
+        completed = None
+        with self.profiler.measure("complete_linked_list"):
+            with self.profiler.measure("complete_linked_list.remove.queue"):
+                if task in self.queue.get_all_tasks():
+                    completed = task
+                    self.queue.remove_task(task)
+            with self.profiler.measure("complete_linked_list.remove.stack"):
+                if self.stack.remove_task(task):
+                    completed = task
+            with self.profiler.measure("complete_linked_list.remove.linked_list"):
+                if self.linked_list.remove_task(task):
+                    completed = task
+            with self.profiler.measure("complete_linked_list.remove.bst"):
+                if self.bst.remove_task(task):
+                    completed = task
+
+            if completed:
+                # Add to global history
+                self.completed_history.append(("Linked List", completed))
+        return completed
+
+    def complete_bst_task(self):
+        with self.profiler.measure("complete_bst"):
+            with self.profiler.measure("complete_bst.pop"):
+                completed = self.bst.complete_highest_priority()
+            if completed:
+                # Remove from other data structures
+                with self.profiler.measure("complete_bst.remove.queue"):
+                    self.queue.remove_task(completed)
+                with self.profiler.measure("complete_bst.remove.stack"):
+                    self.stack.remove_task(completed)
+                with self.profiler.measure("complete_bst.remove.linked_list"):
+                    self.linked_list.remove_task(completed)
+
+                # Add to global history
+                self.completed_history.append(("BST", completed))
+        return completed
+
+    def undo_completion(self, priority):
+        if not self.completed_history:
+            return None
+
+        method, undone_task = self.completed_history.pop()
+
+        # Add back to all data structures
+        self.queue.add_task(undone_task)
+        self.stack.add_task(undone_task)
+        self.linked_list.add_task(undone_task)
+        self.bst.add_task(priority, undone_task)
+        return method, undone_task
+
+    def clear(self):
+        self.queue.clear()
+        self.stack.clear()
+        self.linked_list.clear()
+        self.bst.clear()
+        self.completed_history.clear()
+
+    def merged_tasks(self):
+        # Get tasks from all structures and combine them
+        queue_tasks = self.queue.get_all_tasks()
+        stack_tasks = self.stack.get_all_tasks()
+        ll_tasks = self.linked_list.get_all_tasks()
+        bst_tasks = self.bst.get_all_tasks()
+
+        # Create a unified list (prioritizing BST tasks first since they have priority info)
+        all_tasks = []
+
+        # Add BST tasks first (they have priority info)
+        all_tasks.extend(bst_tasks)
+
+        # Add other tasks, avoiding duplicates
+        for task in queue_tasks + stack_tasks + ll_tasks:
+            if task not in [t.split(": ", 1)[-1] for t in all_tasks]:
+                all_tasks.append(task)
+        return all_tasks
+
+    def to_dict(self):
+        return {
+            "Queue": self.queue.get_all_tasks(),
+            "Stack": {
+                "tasks": self.stack.get_all_tasks(),
+                "history": self.stack.get_history()
+            },
+            "LinkedList": self.linked_list.get_all_tasks(),
+            "BST": self.bst.get_all_tasks(),
+            "BST_Completed": getattr(self.bst, 'completed_tasks', []),
+            "Global_History": self.completed_history
+        }
+
+    def load_dict(self, data):
+        # Load queue tasks
+        for task in data.get("Queue", []):
+            self.queue.add_task(task)
+            self.stack.add_task(task)
+            self.linked_list.add_task(task)
+
+        # Load stack history
+        stack_data = data.get("Stack", {})
+        for task in stack_data.get("history", []):
+            self.stack.completed_stack.append(task)
+
+        # Load BST tasks
+        for task_str in data.get("BST", []):
+            try:
+                priority_str, task = task_str.split(": ", 1)
+                priority = int(priority_str[1:])
+                self.bst.add_task(priority, task)
+            except:
+                continue
+
+        # Load BST completed tasks
+        for task in data.get("BST_Completed", []):
+            if hasattr(self.bst, 'completed_tasks'):
+                self.bst.completed_tasks.append(task)
+
+        # Load global history
+        self.completed_history = data.get("Global_History", [])
+
+
+class BoardStore:
+    DEFAULT_BOARD = "default"
+
+    def __init__(self, directory="boards", default_file="todo_data.json"):
+        self.directory = directory
+        # The default board keeps using the original single-board file
+        self.default_file = default_file
+
+    def path_for(self, name):
+        if not name or name != name.strip() or os.sep in name or "/" in name or name.startswith("."):
+            raise ValueError(f"Invalid board name: {name!r}")
+        if name == self.DEFAULT_BOARD:
+            return self.default_file
+        return os.path.join(self.directory, name + ".json")
+
+    def list_boards(self):
+        names = [self.DEFAULT_BOARD]
+        if os.path.isdir(self.directory):
+            for file_name in sorted(os.listdir(self.directory)):
+                name, ext = os.path.splitext(file_name)
+                if ext == ".json" and name != self.DEFAULT_BOARD:
+                    names.append(name)
+        return names
+
+    def read(self, name):
+        try:
+            with open(self.path_for(name), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def load(self, name):
+        board = Board(name)
+        board.load_dict(self.read(name))
+        return board
+
+    def save(self, board):
+        path = self.path_for(board.name)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(board.to_dict(), f)
+
+
+class BoardCache:
+    """Keeps the most recently used boards in memory.
+
+    Boards are loaded from the store on first access. When more than
+    `capacity` boards are resident, the least recently used one is
+    flushed back to the store and dropped.
+    """
+
+    def __init__(self, store, capacity=3):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.store = store
+        self.capacity = capacity
+        self.boards = OrderedDict()
+
+    def get(self, name):
+        board = self.boards.get(name)
+        if board is not None:
+            self.boards.move_to_end(name)
+            return board
+
+        board = self.store.load(name)
+        self.put(board)
+        return board
+
+    def put(self, board):
+        # Make `board` the most recently used entry under its name
+        self.boards[board.name] = board
+        self.boards.move_to_end(board.name)
+        self._evict()
+
+    def _evict(self):
+        while len(self.boards) > self.capacity:
+            name = next(iter(self.boards))
+            # Save before dropping so a failed write does not lose the board
+            self.store.save(self.boards[name])
+            del self.boards[name]
+
+    def resident(self):
+        return list(self.boards)
+
+    def flush_all(self):
+        for board in self.boards.values():
+            self.store.save(board)
+
+
 class ToDoApp:
-    def __init__(self, root):
+    def __init__(self, root, trace_path=None):
         self.root = root
         self.root.title("Data Structures To-Do App")
         self.root.geometry("1000x750")
@@ -225,22 +682,51 @@ class ToDoApp:
             "light": "#f5f5f5"
         }
 
-        # Data structures
-        self.queue = QueueToDo()
-        self.stack = StackToDo()
-        self.linked_list = LinkedListToDo()
-        self.bst = BSTToDo()
-
-        # Global history tracking
-        self.completed_history = []
+        # Boards (each board holds its own set of data structures)
+        self.boards = BoardCache(BoardStore())
+        self.board = None
+        self.board_var = tk.StringVar(value=BoardStore.DEFAULT_BOARD)
 
         # Priority variable for BST
         self.priority_var = tk.IntVar(value=1)
 
+        # Operation profiler (only records while the metrics panel is open)
+        self.profiler = Profiler()
+        self.metrics_window = None
+
+        # Optional trace of user operations for the replay harness
+        self.recorder = TraceRecorder(trace_path)
+        self.recorder.record("start", self.boards.capacity)
+
         # Setup UI
         self.setup_ui()
         self.load_tasks()
 
+        # Resident boards are written back on exit, like evicted ones
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    # Data structures of the active board
+    @property
+    def queue(self):
+        return self.board.queue
+
+    @property
+    def stack(self):
+        return self.board.stack
+
+    @property
+    def linked_list(self):
+        return self.board.linked_list
+
+    @property
+    def bst(self):
+        return self.board.bst
+
+    # Global history tracking
+    @property
+    def completed_history(self):
+        return self.board.completed_history
+
     def setup_ui(self):
         # Header Frame
         header_frame = tk.Frame(self.root, bg=self.colors["primary"])
@@ -254,6 +740,37 @@ class ToDoApp:
             fg="white"
         ).pack(side=tk.LEFT, padx=10, pady=10)
 
+        # Board Switcher
+        tk.Button(
+            header_frame,
+            text="Switch Board",
+            command=self.switch_board,
+            bg=self.colors["secondary"],
+            fg="white",
+            font=("Segoe UI", 10),
+            relief=tk.FLAT,
+            padx=10
+        ).pack(side=tk.RIGHT, padx=10, pady=10)
+
+        self.board_combo = ttk.Combobox(
+            header_frame,
+            textvariable=self.board_var,
+            values=self.boards.store.list_boards(),
+            width=20,
+            font=("Segoe UI", 10)
+        )
+        self.board_combo.pack(side=tk.RIGHT, pady=10)
+        self.board_combo.bind("<<ComboboxSelected>>", lambda e: self.switch_board())
+        self.board_combo.bind("<Return>", lambda e: self.switch_board())
+
+        tk.Label(
+            header_frame,
+            text="Board:",
+            font=("Segoe UI", 10),
+            bg=self.colors["primary"],
+            fg="white"
+        ).pack(side=tk.RIGHT, padx=5, pady=10)
+
         # Main Content Frame
         content_frame = tk.Frame(self.root, bg=self.colors["light"])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -446,6 +963,19 @@ class ToDoApp:
         )
         save_btn.pack(side=tk.LEFT)
 
+        # Metrics Button
+        metrics_btn = tk.Button(
+            common_ops_frame,
+            text="Metrics",
+            command=self.toggle_metrics_panel,
+            bg=self.colors["secondary"],
+            fg="white",
+            font=("Segoe UI", 10),
+            relief=tk.FLAT,
+            padx=15
+        )
+        metrics_btn.pack(side=tk.RIGHT)
+
         # Status Bar
         self.status_var = tk.StringVar(value="Ready | Tasks: 0")
         status_bar = tk.Label(
@@ -465,51 +995,30 @@ class ToDoApp:
             messagebox.showwarning("Warning", "Please enter a task description!")
             return
 
-        # Add to all data structures
-        self.queue.add_task(task)
-        self.stack.add_task(task)
-        self.linked_list.add_task(task)
-
         # For BST, use the priority value
         priority = self.priority_var.get()
-        self.bst.add_task(priority, task)
+        self.recorder.record("add", task, priority)
+        self.board.add_task(task, priority)
 
         self.task_entry.delete(0, tk.END)
-        self.update_task_list()
-        self.update_status()
+        self.refresh_view()
         messagebox.showinfo("Success", "Task added to all data structures!")
 
     def complete_queue_task(self):
-        completed = self.queue.complete_task()
+        self.recorder.record("complete_queue")
+        completed = self.board.complete_queue_task()
         if completed:
-            # Remove from other data structures
-            self.stack.remove_task(completed)
-            self.linked_list.remove_task(completed)
-            self.bst.remove_task(completed)
-
-            # Add to global history
-            self.completed_history.append(("Queue", completed))
-
             messagebox.showinfo("Queue Task Completed", f"Completed (FIFO): {completed}")
-            self.update_task_list()
-            self.update_status()
+            self.refresh_view()
         else:
             messagebox.showwarning("Warning", "No tasks in queue to complete!")
 
     def complete_stack_task(self):
-        completed = self.stack.complete_task()
+        self.recorder.record("complete_stack")
+        completed = self.board.complete_stack_task()
         if completed:
-            # Remove from other data structures
-            self.queue.remove_task(completed)
-            self.linked_list.remove_task(completed)
-            self.bst.remove_task(completed)
-
-            # Add to global history
-            self.completed_history.append(("Stack", completed))
-
             messagebox.showinfo("Stack Task Completed", f"Completed (LIFO): {completed}")
-            self.update_task_list()
-            self.update_status()
+            self.refresh_view()
         else:
             messagebox.showwarning("Warning", "No tasks in stack to complete!")
 
@@ -523,41 +1032,20 @@ class ToDoApp:
         if task.startswith("P") and ": " in task:
             task = task.split(": ", 1)[1]
 
-        completed = None
-        if task in self.queue.get_all_tasks():
-            completed = task
-            self.queue.remove_task(task)
-        if self.stack.remove_task(task):
-            completed = task
-        if self.linked_list.remove_task(task):
-            completed = task
-        if self.bst.remove_task(task):
-            completed = task
-
+        self.recorder.record("complete_linked_list", task)
+        completed = self.board.complete_linked_list_task(task)
         if completed:
-            # Add to global history
-            self.completed_history.append(("Linked List", completed))
-
             messagebox.showinfo("Task Completed", f"Completed: {completed}")
-            self.update_task_list()
-            self.update_status()
+            self.refresh_view()
         else:
             messagebox.showwarning("Warning", "Could not complete the selected task!")
 
     def complete_bst_task(self):
-        completed = self.bst.complete_highest_priority()
+        self.recorder.record("complete_bst")
+        completed = self.board.complete_bst_task()
         if completed:
-            # Remove from other data structures
-            self.queue.remove_task(completed)
-            self.stack.remove_task(completed)
-            self.linked_list.remove_task(completed)
-
-            # Add to global history
-            self.completed_history.append(("BST", completed))
-
             messagebox.showinfo("BST Task Completed", f"Completed (Highest Priority): {completed}")
-            self.update_task_list()
-            self.update_status()
+            self.refresh_view()
         else:
             messagebox.showwarning("Warning", "No tasks in BST to complete!")
 
@@ -576,51 +1064,31 @@ class ToDoApp:
             messagebox.showwarning("Cannot Undo", "No completed tasks to undo!")
             return
 
-        method, undone_task = self.completed_history.pop()
-
-        # Add back to all data structures
-        self.queue.add_task(undone_task)
-        self.stack.add_task(undone_task)
-        self.linked_list.add_task(undone_task)
-
         # For BST, use current priority value
-        self.bst.add_task(self.priority_var.get(), undone_task)
+        priority = self.priority_var.get()
+        self.recorder.record("undo", priority)
+        method, undone_task = self.board.undo_completion(priority)
 
         messagebox.showinfo("Undo Successful", f"Task restored: {undone_task} (originally completed via {method})")
-        self.update_task_list()
-        self.update_status()
+        self.refresh_view()
 
     def clear_tasks(self):
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all tasks?"):
-            self.queue.clear()
-            self.stack.clear()
-            self.linked_list.clear()
-            self.bst.clear()
-            self.completed_history.clear()
+            self.recorder.record("clear")
+            self.board.clear()
+            self.refresh_view()
+
+    def refresh_view(self):
+        with self.profiler.measure("refresh"):
             self.update_task_list()
             self.update_status()
+        self.profiler.sample_board(self.board)
+        self.update_metrics_panel()
 
     def update_task_list(self):
         self.task_list.delete(0, tk.END)
 
-        # Get tasks from all structures and combine them
-        queue_tasks = self.queue.get_all_tasks()
-        stack_tasks = self.stack.get_all_tasks()
-        ll_tasks = self.linked_list.get_all_tasks()
-        bst_tasks = self.bst.get_all_tasks()
-
-        # Create a unified list (prioritizing BST tasks first since they have priority info)
-        all_tasks = []
-
-        # Add BST tasks first (they have priority info)
-        all_tasks.extend(bst_tasks)
-
-        # Add other tasks, avoiding duplicates
-        for task in queue_tasks + stack_tasks + ll_tasks:
-            if task not in [t.split(": ", 1)[-1] for t in all_tasks]:
-                all_tasks.append(task)
-
-        for task in all_tasks:
+        for task in self.board.merged_tasks():
             self.task_list.insert(tk.END, task)
 
     def update_status(self):
@@ -633,70 +1101,158 @@ class ToDoApp:
         unique_tasks = queue_tasks.union(stack_tasks).union(ll_tasks).union(bst_tasks)
         count = len(unique_tasks)
 
-        self.status_var.set(f"Ready | Tasks: {count}")
+        self.status_var.set(f"Ready | Board: {self.board.name} | Tasks: {count}")
 
     def save_tasks(self):
-        data = {
-            "Queue": self.queue.get_all_tasks(),
-            "Stack": {
-                "tasks": self.stack.get_all_tasks(),
-                "history": self.stack.get_history()
-            },
-            "LinkedList": self.linked_list.get_all_tasks(),
-            "BST": self.bst.get_all_tasks(),
-            "BST_Completed": getattr(self.bst, 'completed_tasks', []),
-            "Global_History": self.completed_history
-        }
-
+        self.recorder.record("save")
         try:
-            with open("todo_data.json", "w") as f:
-                json.dump(data, f)
+            with self.profiler.measure("save"):
+                self.boards.store.save(self.board)
             messagebox.showinfo("Success", "Tasks saved successfully!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save tasks: {str(e)}")
 
     def load_tasks(self):
         try:
-            with open("todo_data.json", "r") as f:
-                data = json.load(f)
-
-            # Load queue tasks
-            for task in data.get("Queue", []):
-                self.queue.add_task(task)
-                self.stack.add_task(task)
-                self.linked_list.add_task(task)
-
-            # Load stack history
-            stack_data = data.get("Stack", {})
-            for task in stack_data.get("history", []):
-                self.stack.completed_stack.append(task)
-
-            # Load BST tasks
-            for task_str in data.get("BST", []):
-                try:
-                    priority_str, task = task_str.split(": ", 1)
-                    priority = int(priority_str[1:])
-                    self.bst.add_task(priority, task)
-                except:
-                    continue
-
-            # Load BST completed tasks
-            for task in data.get("BST_Completed", []):
-                if hasattr(self.bst, 'completed_tasks'):
-                    self.bst.completed_tasks.append(task)
-
-            # Load global history
-            self.completed_history = data.get("Global_History", [])
-
-            self.update_task_list()
-            self.update_status()
-        except FileNotFoundError:
-            pass
+            with self.profiler.measure("load"):
+                self.board = self.boards.get(self.board_var.get())
+            self.board.profiler = self.profiler
+            self.recorder.record_board(self.board.name, self.boards.store)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load tasks: {str(e)}")
+            if self.board is None:
+                # Cache the empty fallback so it is flushed and reused like any board
+                self.board = Board(self.board_var.get(), self.profiler)
+                self.boards.put(self.board)
+                self.recorder.record_board(self.board.name)
+            self.board_var.set(self.board.name)
+
+        self.refresh_view()
+
+    def switch_board(self):
+        name = self.board_var.get().strip()
+        if not name:
+            messagebox.showwarning("Warning", "Please enter a board name!")
+            self.board_var.set(self.board.name)
+            return
+        if name == self.board.name:
+            return
+
+        self.board_var.set(name)
+        self.load_tasks()
+        names = self.boards.store.list_boards()
+        names += [n for n in self.boards.resident() if n not in names]
+        self.board_combo["values"] = names
+
+    def toggle_metrics_panel(self):
+        if self.metrics_window is not None:
+            self.metrics_window.destroy()
+            self.metrics_window = None
+            self.profiler.enabled = False
+            return
+
+        self.profiler.enabled = True
+        self.profiler.sample_board(self.board)
+        self.profiler.sample_height(self.board)
+
+        self.metrics_window = tk.Toplevel(self.root)
+        self.metrics_window.title("Operation Metrics")
+        self.metrics_window.geometry("680x420")
+        self.metrics_window.configure(bg=self.colors["light"])
+        self.metrics_window.protocol("WM_DELETE_WINDOW", self.toggle_metrics_panel)
+
+        self.metrics_text = tk.Text(
+            self.metrics_window,
+            font=("Consolas", 10),
+            relief=tk.FLAT,
+            state=tk.DISABLED
+        )
+        self.metrics_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        buttons_frame = tk.Frame(self.metrics_window, bg=self.colors["light"])
+        buttons_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+        tk.Button(
+            buttons_frame,
+            text="Reset",
+            command=self.reset_metrics,
+            bg=self.colors["danger"],
+            fg="white",
+            font=("Segoe UI", 10),
+            relief=tk.FLAT,
+            padx=10
+        ).pack(side=tk.LEFT, padx=(0, 10))
+
+        tk.Button(
+            buttons_frame,
+            text="Dump to File",
+            command=self.dump_metrics,
+            bg=self.colors["primary"],
+            fg="white",
+            font=("Segoe UI", 10),
+            relief=tk.FLAT,
+            padx=10
+        ).pack(side=tk.LEFT, padx=(0, 10))
+
+        tk.Button(
+            buttons_frame,
+            text="Measure BST Height",
+            command=self.measure_bst_height,
+            bg=self.colors["secondary"],
+            fg="white",
+            font=("Segoe UI", 10),
+            relief=tk.FLAT,
+            padx=10
+        ).pack(side=tk.LEFT)
+
+        self.update_metrics_panel()
+
+    def update_metrics_panel(self):
+        if self.metrics_window is None:
+            return
+        self.metrics_text.config(state=tk.NORMAL)
+        self.metrics_text.delete("1.0", tk.END)
+        self.metrics_text.insert(tk.END, self.profiler.report())
+        self.metrics_text.config(state=tk.DISABLED)
+
+    def reset_metrics(self):
+        self.profiler.reset()
+        self.profiler.sample_board(self.board)
+        self.profiler.sample_height(self.board)
+        self.update_metrics_panel()
+
+    def measure_bst_height(self):
+        self.profiler.sample_height(self.board)
+        self.update_metrics_panel()
+
+    def dump_metrics(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.metrics_window,
+            defaultextension=".json",
+            initialfile="metrics.json",
+            filetypes=[("JSON files", "*.json")]
+        )
+        if not path:
+            return
+        self.profiler.sample_height(self.board)
+        self.update_metrics_panel()
+        try:
+            self.profiler.dump(path)
+            messagebox.showinfo("Success", f"Metrics saved to {path}", parent=self.metrics_window)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save metrics: {str(e)}", parent=self.metrics_window)
+
+    def on_close(self):
+        try:
+            self.boards.flush_all()
+        except Exception as e:
+            if not messagebox.askyesno("Error", f"Failed to save boards: {str(e)}\n\nClose anyway?"):
+                return
+        self.recorder.close()
+        self.root.destroy()
 
 
 if __name__ == "__main__":
     root = tk.Tk()
-    app = ToDoApp(root)
+    app = ToDoApp(root, trace_path=os.environ.get("TODO_TRACE"))
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,407 @@
+"""Headless replay of recorded or generated workload traces.
+
+Record a trace by running the app with TODO_TRACE=<file>, then:
+
+    python replay.py --trace trace.jsonl
+    python replay.py --generate 5000 --mix add=50,complete_bst=20,save=5 --boards 3
+
+Each implementation is replayed through a BoardCache backed by an
+in-memory store, and the report shows throughput, per-operation latency
+percentiles and peak memory. Afterwards every implementation is replayed
+in lockstep and its board state is checked against the first one.
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from benchmark import report_latencies
+from main import Board, BoardCache, read_trace
+
+
+class ReferenceBoard:
+    """Plain-list model of Board, used as the differential oracle.
+
+    It mirrors Board's observable behaviour, including the BST quirks:
+    equal priorities list the newest task first, and removing a task
+    rebuilds the tree (dropping every entry whose text ends with it).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.queue = []
+        self.stack = []
+        self.stack_history = []
+        self.linked_list = []
+        self.bst = []  # (priority, task) in display order
+        self.bst_completed = []
+        self.completed_history = []
+
+    def _bst_insert(self, priority, task):
+        for i, (p, _) in enumerate(self.bst):
+            if p <= priority:
+                self.bst.insert(i, (priority, task))
+                return
+        self.bst.append((priority, task))
+
+    def _bst_remove(self, task):
+        entries = self.bst
+        self.bst = []
+        for p, t in entries:
+            if not f"P{p}: {t}".endswith(task):
+                self._bst_insert(p, t)
+        return task in [t for _, t in entries]
+
+    @staticmethod
+    def _remove(tasks, task):
+        if task in tasks:
+            tasks.remove(task)
+            return True
+        return False
+
+    def add_task(self, task, priority):
+        self.queue.append(task)
+        self.stack.append(task)
+        self.linked_list.append(task)
+        self._bst_insert(priority, task)
+
+    def complete_queue_task(self):
+        completed = self.queue.pop(0) if self.queue else None
+        if completed:
+            self._remove(self.stack, completed)
+            self._remove(self.linked_list, completed)
+            self._bst_remove(completed)
+            self.completed_history.append(("Queue", completed))
+        return completed
+
+    def complete_stack_task(self):
+        completed = None
+        if self.stack:
+            completed = self.stack.pop()
+            self.stack_history.append(completed)
+        if completed:
+            self._remove(self.queue, completed)
+            self._remove(self.linked_list, completed)
+            self._bst_remove(completed)
+            self.completed_history.append(("Stack", completed))
+        return completed
+
+    def complete_linked_list_task(self, task):
+        completed = None
+        if self._remove(self.queue, task):
+            completed = task
+        if self._remove(self.stack, task):
+            completed = task
+        if self._remove(self.linked_list, task):
+            completed = task
+        if self._bst_remove(task):
+            completed = task
+        if completed:
+            self.completed_history.append(("Linked List", completed))
+        return completed
+
+    def complete_bst_task(self):
+        completed = None
+        if self.bst:
+            completed = self.bst.pop(0)[1]
+            self.bst_completed.append(completed)
+        if completed:
+            self._remove(self.queue, completed)
+            self._remove(self.stack, completed)
+            self._remove(self.linked_list, completed)
+            self.completed_history.append(("BST", completed))
+        return completed
+
+    def undo_completion(self, priority):
+        if not self.completed_history:
+            return None
+        method, undone_task = self.completed_history.pop()
+        self.queue.append(undone_task)
+        self.stack.append(undone_task)
+        self.linked_list.append(undone_task)
+        self._bst_insert(priority, undone_task)
+        return method, undone_task
+
+    def clear(self):
+        self.queue.clear()
+        self.stack.clear()
+        self.stack_history.clear()
+        self.linked_list.clear()
+        self.bst.clear()
+        self.bst_completed.clear()
+        self.completed_history.clear()
+
+    def to_dict(self):
+        return {
+            "Queue": list(self.queue),
+            "Stack": {
+                "tasks": list(self.stack),
+                "history": list(self.stack_history)
+            },
+            "LinkedList": list(self.linked_list),
+            "BST": [f"P{p}: {t}" for p, t in self.bst],
+            "BST_Completed": list(self.bst_completed),
+            "Global_History": list(self.completed_history)
+        }
+
+    def load_dict(self, data):
+        # Same rules as Board.load_dict
+        for task in data.get("Queue", []):
+            self.queue.append(task)
+            self.stack.append(task)
+            self.linked_list.append(task)
+        self.stack_history.extend(data.get("Stack", {}).get("history", []))
+        for task_str in data.get("BST", []):
+            try:
+                priority_str, task = task_str.split(": ", 1)
+                self._bst_insert(int(priority_str[1:]), task)
+            except:
+                continue
+        self.bst_completed.extend(data.get("BST_Completed", []))
+        self.completed_history = data.get("Global_History", [])
+
+
+IMPLEMENTATIONS = {
+    "board": Board,
+    "reference": ReferenceBoard,
+}
+
+DEFAULT_MIX = {
+    "add": 40,
+    "complete_queue": 10,
+    "complete_stack": 10,
+    "complete_linked_list": 10,
+    "complete_bst": 10,
+    "undo": 10,
+    "clear": 0,
+    "save": 5,
+    "board": 5,
+}
+
+
+class MemoryBoardStore:
+    """BoardStore stand-in that keeps serialized boards in memory."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.data = {}
+
+    def read(self, name):
+        return self.data.get(name, {})
+
+    def load(self, name):
+        board = self.factory(name)
+        board.load_dict(json.loads(json.dumps(self.read(name))))
+        return board
+
+    def save(self, board):
+        self.data[board.name] = json.loads(json.dumps(board.to_dict()))
+
+
+class Replayer:
+    def __init__(self, factory, capacity=3):
+        self.factory = factory
+        self.start(capacity)
+
+    def start(self, capacity):
+        # Each app session in a trace starts from a fresh store and cache
+        self.store = MemoryBoardStore(self.factory)
+        self.boards = BoardCache(self.store, capacity)
+        self.board = None
+
+    def apply(self, op):
+        name, args = op[0], op[1:]
+        if name == "start":
+            self.start(args[0])
+        elif name == "board":
+            # The first mention of a board in a session carries its stored data
+            if len(args) > 1 and args[0] not in self.store.data:
+                self.store.data[args[0]] = args[1]
+            self.board = self.boards.get(args[0])
+        elif name == "add":
+            self.board.add_task(args[0], args[1])
+        elif name == "complete_queue":
+            self.board.complete_queue_task()
+        elif name == "complete_stack":
+            self.board.complete_stack_task()
+        elif name == "complete_linked_list":
+            self.board.complete_linked_list_task(args[0])
+        elif name == "complete_bst":
+            self.board.complete_bst_task()
+        elif name == "undo":
+            self.board.undo_completion(args[0])
+        elif name == "clear":
+            self.board.clear()
+        elif name == "save":
+            self.store.save(self.board)
+        else:
+            raise ValueError(f"Unknown trace operation: {name!r}")
+
+    def state(self):
+        self.boards.flush_all()
+        return self.store.data
+
+
+def generate_trace(size, mix=None, boards=1, capacity=3, seed=0):
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    operations = [op for op, weight in mix.items() if weight > 0]
+    # Drop operations the generator could never emit, so every draw
+    # appends to the trace (or eventually will, once something is added)
+    if boards < 2 and "board" in operations:
+        operations.remove("board")
+    if "add" not in operations and "complete_linked_list" in operations:
+        operations.remove("complete_linked_list")
+    if not operations:
+        raise ValueError("Operation mix cannot produce any operations "
+                         "(complete_linked_list needs add, board needs --boards > 1)")
+    weights = [mix[op] for op in operations]
+    names = ["default"] + [f"board{i}" for i in range(1, boards)]
+    added = {name: [] for name in names}
+
+    trace = [["start", capacity], ["board", "default", {}]]
+    current = "default"
+    seen = {current}
+    counter = 0
+    while len(trace) < size + 2:
+        op = rng.choices(operations, weights)[0]
+        if op == "add":
+            counter += 1
+            task = f"task {counter}"
+            added[current].append(task)
+            trace.append(["add", task, rng.randint(1, 10)])
+        elif op == "complete_linked_list":
+            if added[current]:
+                trace.append([op, rng.choice(added[current])])
+        elif op == "undo":
+            trace.append([op, rng.randint(1, 10)])
+        elif op == "board":
+            if len(names) > 1:
+                current = rng.choice(names)
+                trace.append(["board", current] if current in seen else ["board", current, {}])
+                seen.add(current)
+        else:
+            trace.append([op])
+    return trace
+
+
+def bench(trace, factory, capacity):
+    replayer = Replayer(factory, capacity)
+    latencies = {}
+    start = time.perf_counter()
+    for op in trace:
+        op_start = time.perf_counter()
+        replayer.apply(op)
+        latencies.setdefault(op[0], []).append(time.perf_counter() - op_start)
+    elapsed = time.perf_counter() - start
+
+    # Separate pass so tracemalloc overhead does not skew the timings
+    tracemalloc.start()
+    replayer = Replayer(factory, capacity)
+    for op in trace:
+        replayer.apply(op)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, latencies, peak
+
+
+def check_equivalence(trace, factories, capacity, check_every=1000):
+    """Replay all implementations in lockstep; return the first mismatch or None."""
+    replayers = {name: Replayer(factory, capacity) for name, factory in factories.items()}
+    baseline = next(iter(replayers))
+
+    def mismatch():
+        states = {name: r.state() for name, r in replayers.items()}
+        for name, state in states.items():
+            if state != states[baseline]:
+                return name
+        return None
+
+    for index, op in enumerate(trace):
+        # A start record discards the previous session, so check it first
+        if op[0] == "start" and index:
+            name = mismatch()
+            if name is not None:
+                return index - 1, trace[index - 1], baseline, name
+        for replayer in replayers.values():
+            replayer.apply(op)
+        if (index + 1) % check_every and index != len(trace) - 1:
+            continue
+        name = mismatch()
+        if name is not None:
+            return index, op, baseline, name
+    return None
+
+
+def report(name, trace, elapsed, latencies, peak):
+    print(f"{name}: {len(trace)} ops in {elapsed:.3f}s "
+          f"({len(trace) / elapsed:,.0f} ops/s), peak memory {peak / 1024:.1f} KiB")
+    report_latencies(dict(sorted(latencies.items())))
+
+
+def parse_mix(text):
+    mix = dict.fromkeys(DEFAULT_MIX, 0)
+    for item in text.split(","):
+        op, _, weight = item.partition("=")
+        if op.strip() not in mix:
+            raise argparse.ArgumentTypeError(f"Unknown operation in mix: {op!r}")
+        mix[op.strip()] = float(weight)
+        if mix[op.strip()] < 0:
+            raise argparse.ArgumentTypeError(f"Negative weight in mix: {item!r}")
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("Operation mix needs at least one positive weight")
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--trace", help="trace file recorded with TODO_TRACE")
+    source.add_argument("--generate", type=int, metavar="N", help="generate a trace with N operations")
+    parser.add_argument("--mix", type=parse_mix, help="operation weights, e.g. add=50,complete_bst=20")
+    parser.add_argument("--boards", type=int, default=1, help="number of boards in a generated trace")
+    parser.add_argument("--capacity", type=int, default=3, help="resident boards in a generated trace")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-trace", metavar="FILE", help="write the generated trace to FILE")
+    parser.add_argument("--impl", default=",".join(IMPLEMENTATIONS),
+                        help="comma-separated implementations to run (default: all)")
+    parser.add_argument("--check-every", type=int, default=1000,
+                        help="compare board state every N ops during the differential check")
+    args = parser.parse_args()
+    if args.check_every < 1:
+        parser.error("--check-every must be at least 1")
+
+    if args.trace:
+        trace = list(read_trace(args.trace))
+    else:
+        try:
+            trace = generate_trace(args.generate, args.mix, args.boards, args.capacity, args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.save_trace:
+            with open(args.save_trace, "w") as f:
+                for op in trace:
+                    f.write(json.dumps(op, separators=(",", ":")) + "\n")
+
+    try:
+        factories = {name: IMPLEMENTATIONS[name] for name in args.impl.split(",")}
+    except KeyError as e:
+        parser.error(f"Unknown implementation: {e.args[0]}")
+
+    for name, factory in factories.items():
+        report(name, trace, *bench(trace, factory, args.capacity))
+
+    if len(factories) > 1:
+        mismatch = check_equivalence(trace, factories, args.capacity, args.check_every)
+        if mismatch is None:
+            print(f"Differential check passed: {', '.join(factories)} agree")
+        else:
+            index, op, baseline, name = mismatch
+            print(f"Differential check FAILED: {name} differs from {baseline} "
+                  f"at op #{index} {op}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
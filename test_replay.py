@@ -0,0 +1,26 @@
+from main import Board
+from replay import ReferenceBoard, check_equivalence
+
+
+class UpperCaseBoard(Board):
+    def add_task(self, task, priority):
+        super().add_task(task.upper(), priority)
+
+
+def two_sessions(first_task, second_task):
+    return [
+        ["start", 3], ["board", "default", {}], ["add", first_task, 1],
+        ["start", 3], ["board", "default", {}], ["add", second_task, 1],
+    ]
+
+
+def test_sessions_agree():
+    trace = two_sessions("task0", "task1")
+    assert check_equivalence(trace, {"board": Board, "reference": ReferenceBoard}, 3) is None
+
+
+def test_mismatch_in_earlier_session_is_reported():
+    # Only the first session differs: "TASK1" is already upper case
+    trace = two_sessions("task0", "TASK1")
+    factories = {"board": Board, "upper": UpperCaseBoard}
+    assert check_equivalence(trace, factories, 3) == (2, ["add", "task0", 1], "board", "upper")